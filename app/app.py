@@ -7,6 +7,9 @@ import pandas as pd
 import streamlit as st
 import altair as alt
 
+from components.event_query import county_summary, ensure_event_indexes, latest_by_resident, recent_events
+from components.registry import RegistryStore
+
 DB_PATH = "edge_agent/rva_events.db"
 REG_PATH = "data/resident_registry.csv"
 
@@ -30,53 +33,39 @@ CHUNGBUK_REGIONS: List[str] = [
 # -----------------------------
 # Helpers
 # -----------------------------
-@st.cache_data(ttl=5)
-def load_events(db_path: str) -> pd.DataFrame:
+@st.cache_resource
+def get_registry(db_path: str, reg_path: str) -> RegistryStore:
+    """이벤트 DB 인덱스 + residents 테이블 준비 (프로세스당 1회)."""
     con = sqlite3.connect(db_path)
     try:
-        # 현재 테이블 컬럼 확인
-        cols = {row[1] for row in con.execute("PRAGMA table_info(events)")}
-        # 필수 컬럼 구성 (없으면 즉석 기본값으로 alias)
-        sel = ["ts", "kind", "level", "note"]
-        if "resident_id" in cols:
-            sel.append("resident_id")
-        else:
-            sel.append("'UNSET' AS resident_id")
-        if "edge_id" in cols:
-            sel.append("edge_id")
-        else:
-            sel.append("'edge-1' AS edge_id")
+        ensure_event_indexes(con)
+    finally:
+        con.close()
+    return RegistryStore(db_path, reg_path)
 
-        sql = f"SELECT {', '.join(sel)} FROM events ORDER BY ts DESC"
-        df = pd.read_sql(sql, con)
-        df["ts"] = pd.to_datetime(df["ts"])
-        return df
+@st.cache_data(ttl=5)
+def query(name: str, *args):
+    """event_query 조회를 짧게 캐시 (같은 리렌더 내 중복 방지)."""
+    fn = {
+        "latest": latest_by_resident,
+        "recent": recent_events,
+        "summary": county_summary,
+    }[name]
+    con = sqlite3.connect(DB_PATH)
+    try:
+        return fn(con, *args)
     finally:
         con.close()
-    df["ts"] = pd.to_datetime(df["ts"], errors="coerce")
-    for col in ["resident_id", "edge_id", "kind", "level", "note"]:
-        if col not in df.columns:
-            df[col] = None
-    return df
 
-def ensure_registry_template(events: pd.DataFrame) -> pd.DataFrame:
-    """등록 파일이 없으면 이벤트의 resident_id로 템플릿 생성."""
-    os.makedirs(os.path.dirname(REG_PATH), exist_ok=True)
-    if os.path.exists(REG_PATH):
-        reg = pd.read_csv(REG_PATH, dtype=str).fillna("미지정")
-    else:
-        ids = sorted(set(events["resident_id"].dropna())) or ["CB-001", "CB-002"]
-        reg = pd.DataFrame({
-            "resident_id": ids,
-            "name": [f"어르신{str(i+1).zfill(2)}" for i in range(len(ids))],
-            "county": ["미지정"] * len(ids),
-        })
-        reg.to_csv(REG_PATH, index=False, encoding="utf-8-sig")
-    # 보정
-    for col in ["resident_id", "name", "county"]:
-        if col not in reg.columns:
-            reg[col] = "미지정"
-    return reg
+@st.cache_data(ttl=5)
+def load_kpis() -> tuple:
+    con = sqlite3.connect(DB_PATH)
+    try:
+        total_alerts = con.execute("SELECT COUNT(*) FROM events WHERE level = 'ALERT'").fetchone()[0]
+        last_ts = con.execute("SELECT MAX(ts) FROM events").fetchone()[0]
+        return int(total_alerts), pd.to_datetime(last_ts)
+    finally:
+        con.close()
 
 def insert_event(ts: datetime, kind: str, level: str, note: str, resident_id: str | None, edge_id: str | None):
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
@@ -85,6 +74,7 @@ def insert_event(ts: datetime, kind: str, level: str, note: str, resident_id: st
     cur.execute(
         """
         create table if not exists events(
+            id integer primary key,
             ts text,
             kind text,
             level text,
@@ -128,29 +118,23 @@ def classify_status(last_row: pd.Series | None) -> str:
 # -----------------------------
 # LOAD
 # -----------------------------
-events = load_events(DB_PATH)
-reg = ensure_registry_template(events)
+os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+store = get_registry(DB_PATH, REG_PATH)
+reg = store.frame()
 
 now = pd.Timestamp.now()
 cut_24h = now - pd.Timedelta(hours=24)
-online_cut = now - pd.Timedelta(seconds=90)
-
-hb = events[events["note"] == "edge alive"].copy()
-hb = hb.sort_values(["resident_id", "ts"], ascending=[True, False])
-online_ids = set(hb.groupby("resident_id").head(1).loc[lambda d: d["ts"] >= online_cut, "resident_id"])
 
 # 지역 필터 UI (React 컨셉과 동일한 경험)
 st.title("RuralVitals — 충북 농촌형 엣지 돌봄 대시보드")
 st.caption("비착용 · 오프라인 추론 · 저비용 다인 커버리지")
 
 region = st.segmented_control("📍 지역 선택", options=CHUNGBUK_REGIONS, default="전체")
-reg_view = reg.copy()
-if region != "전체":
-    reg_view = reg_view[reg_view["county"] == region]
+county = None if region == "전체" else region
+reg_view = reg if county is None else reg[reg["county"] == county]
 
 # KPI
-total_alerts = int((events["level"] == "ALERT").sum())
-last_ts = events["ts"].max() if not events.empty else None
+total_alerts, last_ts = load_kpis()
 
 colA, colB, colC = st.columns(3)
 colA.metric("모니터링 대상자 수", len(reg_view))
@@ -164,13 +148,8 @@ st.subheader("대상자 현황(다인)")
 if len(reg_view) == 0:
     st.info("해당 지역에 등록된 대상자가 없습니다. (data/resident_registry.csv에서 county를 설정하세요)")
 else:
-    # 대상자별 최신 이벤트 머지
-    latest = (
-        events.sort_values("ts", ascending=False)
-        .drop_duplicates(subset=["resident_id"], keep="first")
-        .rename(columns={"ts": "last_ts"})
-    )
-    merged = reg_view.merge(latest[["resident_id", "kind", "level", "note", "last_ts"]], on="resident_id", how="left")
+    # 대상자별 최신 이벤트 (SQL 조인, 해당 시군 대상자만)
+    merged = query("latest", county)
 
     # 간단 KPI 계산(필터된 집합 기준)
     statuses = merged.apply(lambda r: classify_status(r), axis=1)
@@ -222,14 +201,7 @@ else:
 # 충북 시·군 현황 카드 (최근 24h) — 전체 관점
 # -----------------------------
 st.subheader("충청북도 시·군 현황(최근 24시간)")
-merge = events.merge(reg, on="resident_id", how="left")
-merge["county"] = merge["county"].fillna("미지정")
-recent = merge[merge["ts"] >= cut_24h]
-agg = recent.groupby("county").agg(
-    alerts=("level", lambda s: int((s == "ALERT").sum())),
-    residents=("resident_id", "nunique"),
-    latest=("ts", "max"),
-).reset_index()
+agg = query("summary", cut_24h.strftime("%Y-%m-%d %H:%M:%S"))
 
 if agg.empty:
     st.info("최근 24시간 데이터가 없습니다. (아래 데모 이벤트 주입으로 테스트하세요)")
@@ -264,21 +236,18 @@ else:
 # -----------------------------
 st.subheader("통합 알림 피드")
 feed_cols = ["ts", "resident_id", "kind", "level", "note"]
-feed = events.loc[:, [c for c in feed_cols if c in events.columns]].copy()
-if region != "전체":
-    feed = feed.merge(reg_view[["resident_id"]], on="resident_id", how="inner")
-st.dataframe(feed.head(20), use_container_width=True, hide_index=True)
+feed = query("recent", county, 20)
+st.dataframe(feed[feed_cols], use_container_width=True, hide_index=True)
 
 # -----------------------------
 # Event Timeline
 # -----------------------------
 st.caption("Event Timeline (kind/level over time)")
-if not events.empty:
-    ev = events.copy()
-    if region != "전체":
-        ev = ev.merge(reg_view[["resident_id"]], on="resident_id", how="inner")
+ev = query("recent", county, 800)
+if not ev.empty:
+    ev = ev.copy()
     ev["level_kind"] = ev["level"].fillna("") + ", " + ev["kind"].fillna("")
-    ch = alt.Chart(ev.tail(800)).mark_point().encode(
+    ch = alt.Chart(ev).mark_point().encode(
         x=alt.X("ts:T", title="ts"),
         y=alt.Y("kind:N"),
         color=alt.Color("level_kind:N", legend=alt.Legend(title="level,kind")),
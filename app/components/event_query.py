@@ -0,0 +1,470 @@
+# app/components/event_query.py
+"""
+events 테이블 서버측 조회 헬퍼.
+
+- 필터(대상자/시군/엣지/kind/level/기간/메모 검색)는 모두 SQL WHERE 로 처리
+  (시군은 residents 테이블 조인 — app/components/registry.py)
+- 페이지 이동은 OFFSET 대신 (ts, rowid) 키셋 커서 사용 → 깊은 페이지도 인덱스 범위 스캔
+- note 전문검색은 SQLite FTS5(events_fts)가 rowid 역순 키셋으로 페이지를 주도, 미지원 빌드면 LIKE 로 대체
+  · 기간 필터는 시간대별 id 범위(events_span)로 FTS 스캔 구간을 좁힘
+  · 페이지당 FTS 일치 행은 최대 SCAN_BUDGET 개만 확인 → 다른 필터가 선택적이어도 지연 상한 유지
+    (못 채운 페이지는 확인한 위치를 커서로 돌려줘 '다음'에서 이어서 검색)
+- 내보내기는 청크 단위로 파일에 바로 기록(전체 테이블을 메모리에 올리지 않음)
+"""
+import csv
+import itertools
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+EVENT_COLS = ["ts", "resident_id", "edge_id", "kind", "level", "note"]
+
+# (ts, rowid) — 마지막으로 본 행의 위치
+Cursor = Tuple[str, int]
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_ev_ts ON events(ts)",
+    "CREATE INDEX IF NOT EXISTS idx_ev_res_ts ON events(resident_id, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_ev_edge_ts ON events(edge_id, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_ev_kind_ts ON events(kind, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_ev_level_ts ON events(level, ts)",
+]
+
+# id(INTEGER PRIMARY KEY) 를 content_rowid 로 사용 — 암묵적 rowid 는 VACUUM 때 재번호될 수 있어
+# 외부 콘텐츠 FTS 색인이 오류 없이 다른 행을 가리키게 된다
+FTS_TABLE = "CREATE VIRTUAL TABLE events_fts USING fts5(note, content='events', content_rowid='id')"
+
+FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+      INSERT INTO events_fts(rowid, note) VALUES (new.id, new.note);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+      INSERT INTO events_fts(events_fts, rowid, note) VALUES ('delete', old.id, old.note);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF note ON events BEGIN
+      INSERT INTO events_fts(events_fts, rowid, note) VALUES ('delete', old.id, old.note);
+      INSERT INTO events_fts(rowid, note) VALUES (new.id, new.note);
+    END
+    """,
+]
+
+
+# 시간대(YYYY-MM-DD HH)별 id 범위 (기간 필터 → FTS rowid 구간). 삭제 시 줄이지 않으므로 항상 실제 범위를 포함
+SPAN_TABLE = "CREATE TABLE IF NOT EXISTS events_span(hour TEXT PRIMARY KEY, lo INTEGER, hi INTEGER) WITHOUT ROWID"
+
+SPAN_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS events_span_{name} AFTER {op} ON events WHEN new.ts IS NOT NULL BEGIN
+      INSERT INTO events_span(hour, lo, hi) VALUES (substr(new.ts, 1, 13), new.id, new.id)
+      ON CONFLICT(hour) DO UPDATE SET lo = MIN(lo, excluded.lo), hi = MAX(hi, excluded.hi);
+    END
+    """
+    for name, op in (("ai", "INSERT"), ("au", "UPDATE OF ts"))
+]
+
+# 검색 페이지 1회에 확인하는 FTS 일치 행 상한 (1M 행 기준 ~70 ms)
+SCAN_BUDGET = 100_000
+
+
+@dataclass
+class EventFilter:
+    resident_ids: List[str] = field(default_factory=list)
+    counties: List[str] = field(default_factory=list)
+    edge_ids: List[str] = field(default_factory=list)
+    kinds: List[str] = field(default_factory=list)
+    levels: List[str] = field(default_factory=list)
+    ts_from: Optional[str] = None   # "YYYY-MM-DD HH:MM:SS" (포함)
+    ts_to: Optional[str] = None     # "YYYY-MM-DD HH:MM:SS" (포함)
+    text: Optional[str] = None      # note 전문검색어
+
+
+def _ensure_stable_key(cur: sqlite3.Cursor) -> bool:
+    """
+    events 에 INTEGER PRIMARY KEY(id) 가 없으면 기존 rowid 를 id 로 보존해 1회 재구성.
+    (예전 에이전트/시드 스키마 — 큰 DB 는 최초 1회 테이블 복사 시간이 든다) 재구성했으면 True.
+    """
+    info = list(cur.execute("PRAGMA table_info(events)"))
+    pks = [r for r in info if r[5]]
+    if len(pks) == 1 and pks[0][2].upper() == "INTEGER":
+        return False
+    defs = ", ".join(
+        f"{name} {typ}" + (" NOT NULL" if notnull else "") + (f" DEFAULT {dflt}" if dflt is not None else "")
+        for _, name, typ, notnull, dflt, _ in info
+    )
+    cols = ", ".join(r[1] for r in info)
+    # 테이블과 함께 인덱스/트리거도 사라지므로 호출 측에서 다시 만든다
+    cur.executescript(f"""
+        BEGIN;
+        CREATE TABLE events_new(id INTEGER PRIMARY KEY, {defs});
+        INSERT INTO events_new(id, {cols}) SELECT rowid, {cols} FROM events;
+        DROP TABLE events;
+        ALTER TABLE events_new RENAME TO events;
+        COMMIT;
+    """)
+    return True
+
+
+def ensure_event_indexes(con: sqlite3.Connection) -> bool:
+    """조회용 키/인덱스/FTS 준비. FTS5 사용 가능 여부를 반환."""
+    cur = con.cursor()
+    cur.execute(
+        "CREATE TABLE IF NOT EXISTS events("
+        "id INTEGER PRIMARY KEY, ts TEXT, kind TEXT, level TEXT, note TEXT, resident_id TEXT, edge_id TEXT)"
+    )
+    # 에이전트/시드 스크립트별로 스키마가 달라 없는 컬럼은 보강
+    cols = {r[1] for r in cur.execute("PRAGMA table_info(events)")}
+    for col in ("resident_id", "edge_id"):
+        if col not in cols:
+            cur.execute(f"ALTER TABLE events ADD COLUMN {col} TEXT")
+    migrated = _ensure_stable_key(cur)
+    for stmt in INDEXES:
+        cur.execute(stmt)
+
+    has_span = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='events_span'"
+    ).fetchone() is not None
+    cur.execute(SPAN_TABLE)
+    for stmt in SPAN_TRIGGERS:
+        cur.execute(stmt)
+    if not has_span:
+        cur.execute(
+            "INSERT INTO events_span(hour, lo, hi)"
+            " SELECT substr(ts, 1, 13), MIN(id), MAX(id) FROM events WHERE ts IS NOT NULL GROUP BY 1"
+        )
+
+    has_fts = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='events_fts'"
+    ).fetchone() is not None
+    try:
+        if not has_fts:
+            cur.execute(FTS_TABLE)
+        for stmt in FTS_TRIGGERS:
+            cur.execute(stmt)
+        if not has_fts or migrated:
+            # 최초 색인, 또는 키 재구성 후 (그 전 VACUUM 으로 rowid 가 바뀌었을 수 있음) 재색인
+            cur.execute("INSERT INTO events_fts(events_fts) VALUES('rebuild')")
+        has_fts = True
+    except sqlite3.OperationalError:
+        # fts5 미포함 SQLite 빌드 → LIKE 검색으로 대체
+        has_fts = False
+    con.commit()
+    return has_fts
+
+
+def distinct_values(con: sqlite3.Connection, col: str) -> List[str]:
+    """
+    (col, ts) 인덱스를 건너뛰며 고유값 수집.
+    SELECT DISTINCT 는 인덱스 전체를 훑지만, MIN(col) WHERE col > ? 는 값마다 O(log n).
+    """
+    if col not in EVENT_COLS:
+        raise ValueError(f"unknown column: {col}")
+    out: List[str] = []
+    row = con.execute(f"SELECT MIN({col}) FROM events").fetchone()
+    while row and row[0] is not None:
+        out.append(row[0])
+        row = con.execute(f"SELECT MIN({col}) FROM events WHERE {col} > ?", (row[0],)).fetchone()
+    return out
+
+
+def _in_clause(col: str, values: List[str], where: List[str], params: list):
+    where.append(f"{col} IN ({', '.join('?' * len(values))})")
+    params.extend(values)
+
+
+def _fts_query(text: str) -> str:
+    # 사용자 입력을 FTS 구문이 아닌 구(phrase)로 취급
+    return '"' + text.replace('"', '""') + '"'
+
+
+def build_where(flt: EventFilter, has_fts: bool) -> Tuple[List[str], list, Optional[str]]:
+    """(WHERE 조건, 파라미터, FTS MATCH 식 또는 None)"""
+    where: List[str] = []
+    params: list = []
+    if flt.resident_ids:
+        _in_clause("resident_id", flt.resident_ids, where, params)
+    if flt.counties:
+        # 시군 필터는 residents(county, resident_id) 인덱스로 조인
+        where.append(
+            f"resident_id IN (SELECT resident_id FROM residents WHERE county IN ({', '.join('?' * len(flt.counties))}))"
+        )
+        params.extend(flt.counties)
+    if flt.edge_ids:
+        _in_clause("edge_id", flt.edge_ids, where, params)
+    if flt.kinds:
+        _in_clause("kind", flt.kinds, where, params)
+    if flt.levels:
+        _in_clause("level", flt.levels, where, params)
+    if flt.ts_from:
+        where.append("ts >= ?")
+        params.append(flt.ts_from)
+    if flt.ts_to:
+        where.append("ts <= ?")
+        params.append(flt.ts_to)
+    match = None
+    if flt.text:
+        if has_fts:
+            match = _fts_query(flt.text)
+        else:
+            where.append("note LIKE ?")
+            params.append(f"%{flt.text}%")
+    return where, params, match
+
+
+def _id_span(con: sqlite3.Connection, flt: EventFilter) -> Optional[Tuple[Optional[int], Optional[int]]]:
+    """기간 필터를 포함하는 id 범위 (lo, hi). 기간 필터가 없으면 None."""
+    if not (flt.ts_from or flt.ts_to):
+        return None
+    where, params = [], []
+    if flt.ts_from:
+        where.append("hour >= ?")
+        params.append(flt.ts_from[:13])
+    if flt.ts_to:
+        where.append("hour <= ?")
+        params.append(flt.ts_to[:13])
+    return con.execute(f"SELECT MIN(lo), MAX(hi) FROM events_span WHERE {' AND '.join(where)}", params).fetchone()
+
+
+def _search(
+    con, where: List[str], params: list, after: Optional[Cursor], limit: int, match: str, span=None
+) -> Tuple[List[tuple], Optional[Cursor]]:
+    """
+    FTS 가 페이지를 주도: 일치 행을 rowid 역순(=삽입 순)으로 훑으며 나머지 조건은 행마다 확인.
+    일치 rowid 구간을 작은 창부터 4배씩 넓혀 가며 훑고(흔한 검색어는 첫 창에서 끝남),
+    합계 SCAN_BUDGET 개를 확인하면 멈춘다.
+    반환: (행, 재개 커서 — 상한에 걸려 limit 를 못 채운 경우만)
+    """
+    lo, hi = -(2**63), 2**63 - 1
+    if after is not None:
+        hi = after[1] - 1
+    if span is not None:
+        if span[0] is None:
+            return [], None  # 기간 안에 행 없음
+        lo, hi = span[0], min(hi, span[1])
+    sql = (
+        f"SELECT e.rowid, {', '.join('e.' + c for c in EVENT_COLS)}"
+        " FROM events_fts f CROSS JOIN events e ON e.rowid = f.rowid"
+        " WHERE events_fts MATCH ? AND f.rowid BETWEEN ? AND ?"
+    )
+    if where:
+        sql += " AND " + " AND ".join(where)
+    sql += " ORDER BY f.rowid DESC LIMIT ?"
+
+    out: List[tuple] = []
+    window, examined = max(4 * limit, 1_000), 0
+    while True:
+        n = min(window, SCAN_BUDGET - examined)
+        # 이번 창의 하한 = 위에서부터 n 번째 일치 rowid
+        floor, seen = con.execute(
+            "SELECT MIN(rowid), COUNT(*) FROM ("
+            " SELECT rowid FROM events_fts WHERE events_fts MATCH ? AND rowid BETWEEN ? AND ?"
+            " ORDER BY rowid DESC LIMIT ?)",
+            [match, lo, hi, n],
+        ).fetchone()
+        if not seen:
+            return out, None
+        out += con.execute(sql, [match, floor, hi] + params + [limit - len(out)]).fetchall()
+        examined += seen
+        if len(out) >= limit or seen < n:
+            return out, None
+        hi = floor - 1
+        if examined >= SCAN_BUDGET:
+            return out, (con.execute("SELECT ts FROM events WHERE id = ?", (floor,)).fetchone()[0], floor)
+        window *= 4
+
+
+def _select(
+    con, where: List[str], params: list, after: Optional[Cursor], limit: int, match: Optional[str] = None, span=None
+) -> Tuple[List[tuple], Optional[Cursor]]:
+    """(행, 재개 커서). 재개 커서는 검색 상한에 걸렸을 때만 (_search)."""
+    if match is not None:
+        return _search(con, where, params, after, limit, match, span)
+    where, params = list(where), list(params)
+    if after is not None:
+        # ts <= ? 가 인덱스 범위 조건, 나머지는 동일 ts 내 tie-break
+        where.append("ts <= ? AND (ts < ? OR rowid < ?)")
+        params.extend([after[0], after[0], after[1]])
+    sql = f"SELECT rowid, {', '.join(EVENT_COLS)} FROM events"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY ts DESC, rowid DESC LIMIT ?"
+    return con.execute(sql, params + [limit]).fetchall(), None
+
+
+def fetch_page(
+    con: sqlite3.Connection,
+    flt: EventFilter,
+    after: Optional[Cursor] = None,
+    limit: int = 100,
+    has_fts: bool = True,
+) -> Tuple[pd.DataFrame, Optional[Cursor]]:
+    """
+    키셋 페이지 조회 (ts DESC, rowid DESC; 메모 검색 시에는 rowid DESC = 기록 순).
+    반환: (페이지 DataFrame, 다음 페이지 커서 또는 None)
+    메모 검색은 페이지가 limit 보다 적어도 커서가 있을 수 있음 (검색 상한 도달 → 이어서 검색)
+    """
+    where, params, match = build_where(flt, has_fts)
+    span = _id_span(con, flt) if match is not None else None
+    # limit+1 로 다음 페이지 존재 여부 확인 (COUNT(*) 없이)
+    rows, next_cursor = _select(con, where, params, after, limit + 1, match, span)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = (rows[-1][1], rows[-1][0])
+    df = pd.DataFrame([r[1:] for r in rows], columns=EVENT_COLS)
+    df["ts"] = pd.to_datetime(df["ts"], errors="coerce")
+    return df, next_cursor
+
+
+def iter_chunks(
+    con: sqlite3.Connection,
+    flt: EventFilter,
+    chunk_rows: int = 50_000,
+    has_fts: bool = True,
+) -> Iterator[List[tuple]]:
+    """필터 결과를 키셋 커서로 chunk_rows 씩 순회 (원본 문자열 튜플)."""
+    where, params, match = build_where(flt, has_fts)
+    span = _id_span(con, flt) if match is not None else None
+    after: Optional[Cursor] = None
+    while True:
+        rows, resume = _select(con, where, params, after, chunk_rows, match, span)
+        if rows:
+            yield [r[1:] for r in rows]
+        if len(rows) == chunk_rows:
+            after = (rows[-1][1], rows[-1][0])
+        elif resume is not None:
+            after = resume
+        else:
+            return
+
+
+def _read(con: sqlite3.Connection, sql: str, params: list, ts_cols=("ts",)) -> pd.DataFrame:
+    df = pd.read_sql(sql, con, params=params)
+    for c in ts_cols:
+        df[c] = pd.to_datetime(df[c], errors="coerce")
+    return df
+
+
+def latest_by_resident(con: sqlite3.Connection, county: Optional[str] = None) -> pd.DataFrame:
+    """
+    등록 대상자별 최신 이벤트 1건 (residents LEFT JOIN).
+    대상자마다 (resident_id, ts) 인덱스 1회 탐색 → 비용은 해당 시군 대상자 수에 비례.
+    """
+    sql = """
+        SELECT r.resident_id, r.name, CAST(r.age AS TEXT) AS age, r.county, r.room,
+               e.kind, e.level, e.note, e.ts AS last_ts
+        FROM residents r
+        LEFT JOIN events e ON e.rowid = (
+            SELECT rowid FROM events WHERE resident_id = r.resident_id ORDER BY ts DESC LIMIT 1
+        )
+    """
+    params: list = []
+    if county:
+        sql += " WHERE r.county = ?"
+        params.append(county)
+    sql += " ORDER BY r.resident_id"
+    return _read(con, sql, params, ts_cols=("last_ts",))
+
+
+def recent_events(con: sqlite3.Connection, county: Optional[str] = None, limit: int = 20) -> pd.DataFrame:
+    """최근 이벤트 limit 건. 시군 지정 시 대상자별 상위 limit 건만 모아 병합."""
+    cols = ", ".join(f"e.{c}" for c in EVENT_COLS)
+    if county:
+        sql = f"""
+            SELECT {cols} FROM residents r
+            JOIN events e ON e.rowid IN (
+                SELECT rowid FROM events WHERE resident_id = r.resident_id ORDER BY ts DESC LIMIT ?
+            )
+            WHERE r.county = ?
+            ORDER BY e.ts DESC LIMIT ?
+        """
+        params: list = [limit, county, limit]
+    else:
+        sql = f"SELECT {cols} FROM events e ORDER BY e.ts DESC LIMIT ?"
+        params = [limit]
+    return _read(con, sql, params)
+
+
+def county_summary(con: sqlite3.Connection, since: str) -> pd.DataFrame:
+    """since 이후 시군별 ALERT 수/대상자 수/최근 시각 (ts 인덱스 범위 + residents 조인)."""
+    sql = """
+        SELECT COALESCE(r.county, '미지정') AS county,
+               SUM(e.level = 'ALERT') AS alerts,
+               COUNT(DISTINCT e.resident_id) AS residents,
+               MAX(e.ts) AS latest
+        FROM events e
+        LEFT JOIN residents r ON r.resident_id = e.resident_id
+        WHERE e.ts >= ?
+        GROUP BY 1
+    """
+    return _read(con, sql, [since], ts_cols=("latest",))
+
+
+def _write_csv(chunks: Iterable[List[tuple]], out_path: str) -> int:
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    n = 0
+    with open(out_path, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(EVENT_COLS)
+        for chunk in chunks:
+            w.writerows(chunk)
+            n += len(chunk)
+    return n
+
+
+def _write_parquet(chunks: Iterable[List[tuple]], out_path: str) -> int:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    schema = pa.schema([(c, pa.string()) for c in EVENT_COLS])
+    n = 0
+    with pq.ParquetWriter(out_path, schema, compression="zstd") as writer:
+        for chunk in chunks:
+            cols = list(zip(*chunk))
+            writer.write_table(pa.Table.from_arrays([pa.array(c, type=pa.string()) for c in cols], schema=schema))
+            n += len(chunk)
+    return n
+
+
+def export_csv(con: sqlite3.Connection, flt: EventFilter, out_path: str, **kw) -> int:
+    """CSV 로 청크 스트리밍 기록. 기록한 행 수 반환."""
+    return _write_csv(iter_chunks(con, flt, **kw), out_path)
+
+
+def export_parquet(con: sqlite3.Connection, flt: EventFilter, out_path: str, **kw) -> int:
+    """Parquet 로 청크(row group) 단위 기록. pyarrow 필요."""
+    return _write_parquet(iter_chunks(con, flt, **kw), out_path)
+
+
+def export_parts(
+    con: sqlite3.Connection,
+    flt: EventFilter,
+    out_dir: str,
+    fmt: str = "csv",
+    part_rows: int = 1_000_000,
+    chunk_rows: int = 50_000,
+    **kw,
+) -> List[Tuple[str, int]]:
+    """
+    파일당 최대 part_rows 행으로 나눠 기록 (브라우저 다운로드 1건 크기를 제한).
+    fmt: "csv" | "parquet". [(경로, 행 수)] 반환 — 결과가 없어도 헤더만 있는 1개.
+    """
+    write = _write_csv if fmt == "csv" else _write_parquet
+    chunk_rows = min(chunk_rows, part_rows)
+    chunks = iter_chunks(con, flt, chunk_rows=chunk_rows, **kw)
+    per_part = max(1, part_rows // chunk_rows)
+    parts: List[Tuple[str, int]] = []
+    first = next(chunks, None)
+    while first is not None or not parts:
+        path = os.path.join(out_dir, f"part{len(parts) + 1:03d}.{fmt}")
+        group = itertools.chain([first] if first is not None else [], itertools.islice(chunks, per_part - 1))
+        parts.append((path, write(group, path)))
+        first = next(chunks, None)
+    return parts
@@ -0,0 +1,149 @@
+# app/components/registry.py
+"""
+대상자 등록부(resident registry) 저장소.
+
+- 원본은 data/resident_registry.csv, 이벤트 DB 의 residents 테이블로 가져와 SQL 조인에 사용
+- CSV 변경(mtime/size) 시에만 재적재, residents 테이블 변경은 트리거가 version 을 올려 감지
+- DataFrame 은 (CSV 스탬프, 테이블 version) 키로 프로세스 내 캐시 → 리렌더마다 CSV 를 읽지 않음
+"""
+import csv
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+REGISTRY_COLS = ["resident_id", "name", "age", "county", "room"]
+UNASSIGNED = "미지정"
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS residents(
+      resident_id TEXT PRIMARY KEY,
+      name        TEXT,
+      age         INTEGER,
+      county      TEXT,   -- 충북 시·군
+      room        TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_res_county ON residents(county, resident_id)",
+    "CREATE TABLE IF NOT EXISTS registry_meta(key TEXT PRIMARY KEY, value TEXT)",
+    "INSERT OR IGNORE INTO registry_meta(key, value) VALUES('version', '0')",
+] + [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS residents_ver_{op[:3].lower()} AFTER {op} ON residents BEGIN
+      UPDATE registry_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'version';
+    END
+    """
+    for op in ("INSERT", "UPDATE", "DELETE")
+]
+
+# db_path -> ((csv 스탬프, version), DataFrame)
+_CACHE: Dict[str, Tuple[tuple, pd.DataFrame]] = {}
+
+
+def ensure_registry_schema(con: sqlite3.Connection):
+    cur = con.cursor()
+    cols = {r[1] for r in cur.execute("PRAGMA table_info(residents)")}
+    # 예전 seed_demo 스키마(region) → county
+    if "region" in cols and "county" not in cols:
+        cur.execute("ALTER TABLE residents RENAME COLUMN region TO county")
+    for stmt in SCHEMA:
+        cur.execute(stmt)
+    con.commit()
+
+
+def _csv_stamp(csv_path: str) -> Optional[str]:
+    if not os.path.exists(csv_path):
+        return None
+    st = os.stat(csv_path)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _meta(con: sqlite3.Connection, key: str) -> Optional[str]:
+    row = con.execute("SELECT value FROM registry_meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _to_int(v: str) -> Optional[int]:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def import_registry_csv(con: sqlite3.Connection, csv_path: str) -> int:
+    """CSV 를 residents 로 통째로 교체(CSV 가 기준). 적재 행 수 반환."""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        rows = [
+            (
+                r["resident_id"].strip(),
+                (r.get("name") or UNASSIGNED).strip(),
+                _to_int(r.get("age")),
+                (r.get("county") or UNASSIGNED).strip(),
+                (r.get("room") or "").strip() or None,
+            )
+            for r in csv.DictReader(f)
+            if (r.get("resident_id") or "").strip()
+        ]
+    with con:
+        con.execute("DELETE FROM residents")
+        con.executemany(
+            "INSERT OR REPLACE INTO residents(resident_id, name, age, county, room) VALUES(?,?,?,?,?)", rows
+        )
+        con.execute(
+            "INSERT OR REPLACE INTO registry_meta(key, value) VALUES('csv_stamp', ?)", (_csv_stamp(csv_path),)
+        )
+    return len(rows)
+
+
+def write_registry_template(csv_path: str, resident_ids: List[str]):
+    """등록 파일이 없을 때 이벤트의 resident_id 로 템플릿 생성."""
+    os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+    ids = sorted(set(resident_ids)) or ["CB-001", "CB-002"]
+    with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(REGISTRY_COLS)
+        for i, rid in enumerate(ids):
+            w.writerow([rid, f"어르신{str(i+1).zfill(2)}", "", UNASSIGNED, ""])
+
+
+class RegistryStore:
+    """residents 테이블 + CSV 동기화 + 프로세스 내 캐시."""
+
+    def __init__(self, db_path: str, csv_path: str):
+        self.db_path = db_path
+        self.csv_path = csv_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        con = sqlite3.connect(db_path)
+        try:
+            ensure_registry_schema(con)
+        finally:
+            con.close()
+
+    def sync(self, con: sqlite3.Connection) -> str:
+        """CSV 가 바뀌었으면 재적재. 현재 캐시 키용 version 반환."""
+        if not os.path.exists(self.csv_path):
+            ids = [r[0] for r in con.execute("SELECT DISTINCT resident_id FROM events WHERE resident_id IS NOT NULL")]
+            write_registry_template(self.csv_path, ids)
+        if _meta(con, "csv_stamp") != _csv_stamp(self.csv_path):
+            import_registry_csv(con, self.csv_path)
+        return _meta(con, "version") or "0"
+
+    def frame(self) -> pd.DataFrame:
+        """등록부 DataFrame(문자열, 결측은 '미지정'). 변경 없으면 캐시 반환."""
+        con = sqlite3.connect(self.db_path)
+        try:
+            version = self.sync(con)
+            key = (_csv_stamp(self.csv_path), version)
+            hit = _CACHE.get(self.db_path)
+            if hit is not None and hit[0] == key:
+                return hit[1]
+            df = pd.read_sql(
+                "SELECT resident_id, name, CAST(age AS TEXT) AS age, county, room FROM residents ORDER BY resident_id",
+                con,
+            ).fillna(UNASSIGNED)
+        finally:
+            con.close()
+        _CACHE[self.db_path] = (key, df)
+        return df
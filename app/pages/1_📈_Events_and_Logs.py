@@ -1,40 +1,182 @@
 import os
+import shutil
 import sqlite3
-from datetime import datetime
-import pandas as pd
+import sys
+import time
+import uuid
+from datetime import datetime, time as dtime
 import streamlit as st
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.event_query import (  # noqa: E402
+    EventFilter, distinct_values, ensure_event_indexes, fetch_page, export_parts,
+)
+from components.registry import RegistryStore  # noqa: E402
+
 DB_PATH = "edge_agent/rva_events.db"
+REG_PATH = "data/resident_registry.csv"
+EXPORT_DIR = "exports"
+EXPORT_PART_ROWS = 1_000_000   # 다운로드 1건(파트)당 최대 행 수 — CSV 기준 약 70 MB
+EXPORT_TTL_SEC = 3600          # 이보다 오래된 내보내기는 삭제
 
 st.set_page_config(page_title="Events and Logs", page_icon="📈", layout="wide")
 st.title("📈 Events and Logs")
 
-@st.cache_data(ttl=5)
-def load_events():
-    if not os.path.exists(DB_PATH):
-        return pd.DataFrame(columns=["ts", "kind", "level", "note", "resident_id", "edge_id"])
+@st.cache_resource
+def prepare_db(db_path: str) -> tuple[bool, RegistryStore]:
+    """인덱스/FTS/residents 준비는 프로세스당 1회. (FTS5 사용 가능 여부, 등록부 저장소) 반환."""
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    con = sqlite3.connect(db_path)
+    try:
+        has_fts = ensure_event_indexes(con)
+    finally:
+        con.close()
+    return has_fts, RegistryStore(db_path, REG_PATH)
+
+@st.cache_data(ttl=60)
+def load_distinct(col: str) -> list:
     con = sqlite3.connect(DB_PATH)
-    df = pd.read_sql("select * from events order by ts desc", con)
-    con.close()
-    df["ts"] = pd.to_datetime(df["ts"])
-    return df
+    try:
+        return distinct_values(con, col)
+    finally:
+        con.close()
 
 def insert_event(ts, kind, level, note, resident_id=None, edge_id=None):
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     con = sqlite3.connect(DB_PATH)
     con.execute(
-        "create table if not exists events(ts text, kind text, level text, note text, resident_id text, edge_id text)"
+        "create table if not exists events(id integer primary key, ts text, kind text, level text, note text, resident_id text, edge_id text)"
     )
     con.execute(
-        "insert into events values(?,?,?,?,?,?)",
+        "insert into events(ts,kind,level,note,resident_id,edge_id) values(?,?,?,?,?,?)",
         (ts.strftime("%Y-%m-%d %H:%M:%S"), kind, level, note, resident_id, edge_id),
     )
     con.commit()
     con.close()
 
-df = load_events()
+def cleanup_exports(keep: str | None = None):
+    """EXPORT_TTL_SEC 지난 내보내기 삭제 (keep 제외)."""
+    if not os.path.isdir(EXPORT_DIR):
+        return
+    cutoff = time.time() - EXPORT_TTL_SEC
+    for name in os.listdir(EXPORT_DIR):
+        path = os.path.join(EXPORT_DIR, name)
+        if path == keep or os.path.getmtime(path) >= cutoff:
+            continue
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.remove(path)  # 예전 단일 파일 내보내기
+
+has_fts, store = prepare_db(DB_PATH)
+reg = store.frame()
+
+# -----------------------------
+# 필터 (모두 SQL WHERE 로 전달)
+# -----------------------------
+with st.container(border=True):
+    f1, f2, f3 = st.columns(3)
+    counties = f1.multiselect("시·군", sorted(reg["county"].unique()))
+    residents = f2.multiselect("대상자", sorted(reg["resident_id"].unique()) if not reg.empty else load_distinct("resident_id"))
+    edges = f3.multiselect("엣지 ID", load_distinct("edge_id"))
+    f4, f5, f6 = st.columns(3)
+    kinds = f4.multiselect("kind", load_distinct("kind"))
+    levels = f5.multiselect("level", load_distinct("level"))
+    text = f6.text_input("메모(note) 검색", placeholder="예: out of range")
+    f7, f8, f9 = st.columns(3)
+    use_range = f7.checkbox("기간 지정")
+    d_from = f8.date_input("시작일", disabled=not use_range)
+    d_to = f9.date_input("종료일", disabled=not use_range)
+
+flt = EventFilter(
+    resident_ids=residents,
+    counties=counties,
+    edge_ids=edges,
+    kinds=kinds,
+    levels=levels,
+    ts_from=datetime.combine(d_from, dtime.min).strftime("%Y-%m-%d %H:%M:%S") if use_range else None,
+    ts_to=datetime.combine(d_to, dtime.max).strftime("%Y-%m-%d %H:%M:%S") if use_range else None,
+    text=text.strip() or None,
+)
+
+# 필터가 바뀌면 첫 페이지로
+flt_key = repr(flt)
+if st.session_state.get("ev_flt_key") != flt_key:
+    st.session_state["ev_flt_key"] = flt_key
+    st.session_state["ev_cursors"] = [None]
+
+page_size = st.selectbox("페이지 크기", [50, 100, 200, 500], index=1)
+cursors = st.session_state["ev_cursors"]
+
+con = sqlite3.connect(DB_PATH)
+try:
+    df, next_cursor = fetch_page(con, flt, after=cursors[-1], limit=page_size, has_fts=has_fts)
+finally:
+    con.close()
+
 st.dataframe(df, use_container_width=True, hide_index=True)
 
+p1, p2, p3 = st.columns([1, 1, 4])
+with p1:
+    if st.button("◀ 이전", disabled=len(cursors) <= 1):
+        cursors.pop()
+        st.rerun()
+with p2:
+    if st.button("다음 ▶", disabled=next_cursor is None):
+        cursors.append(next_cursor)
+        st.rerun()
+p3.caption(
+    f"{len(cursors)} 페이지 · {len(df)}건"
+    + ("" if has_fts else " · (FTS5 미지원: LIKE 검색)")
+    # 메모 검색은 한 번에 확인하는 범위가 제한됨 → 덜 찬 페이지도 이어서 검색 가능
+    + (" · 검색 범위 일부만 확인 — '다음 ▶'으로 이어서 검색" if next_cursor is not None and len(df) < page_size else "")
+)
+
+# -----------------------------
+# 내보내기 — 청크 단위로 파트 파일에 기록, 파트별 다운로드
+# -----------------------------
+with st.expander("⬇️ 내보내기 (현재 필터)"):
+    fmt = st.radio("형식", ["CSV", "Parquet"], horizontal=True)
+    st.caption(f"파일은 {EXPORT_PART_ROWS:,}행 단위 파트로 나뉘며, {EXPORT_TTL_SEC // 60}분 뒤 서버에서 삭제됩니다.")
+    if st.button("내보내기 파일 생성"):
+        # 내보내기마다 고유 폴더 — 이 세션의 이전 내보내기는 바로, 나머지는 TTL 후 정리
+        prev = st.session_state.pop("ev_export", None)
+        if prev is not None:
+            shutil.rmtree(prev[0], ignore_errors=True)
+        out_dir = os.path.join(EXPORT_DIR, f"events_{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}")
+        cleanup_exports(keep=out_dir)
+        con = sqlite3.connect(DB_PATH)
+        try:
+            with st.spinner("내보내는 중…"):
+                parts = export_parts(
+                    con, flt, out_dir, "csv" if fmt == "CSV" else "parquet",
+                    part_rows=EXPORT_PART_ROWS, has_fts=has_fts,
+                )
+        finally:
+            con.close()
+        st.session_state["ev_export"] = (out_dir, parts)
+    if "ev_export" in st.session_state:
+        out_dir, parts = st.session_state["ev_export"]
+        if os.path.isdir(out_dir):
+            total = sum(n for _, n in parts)
+            size = sum(os.path.getsize(p) for p, _ in parts if os.path.exists(p))
+            st.caption(f"{total:,}건 · {len(parts)}개 파트 · {size / 1e6:.1f} MB")
+            # 한 번에 한 파트만 메모리에 올려 다운로드 버튼 생성
+            idx = 0
+            if len(parts) > 1:
+                idx = st.selectbox(
+                    "파트", range(len(parts)),
+                    format_func=lambda i: f"{os.path.basename(parts[i][0])} ({parts[i][1]:,}건)",
+                )
+            path, _ = parts[idx]
+            with open(path, "rb") as f:
+                st.download_button(
+                    "다운로드", f, file_name=f"{os.path.basename(out_dir)}_{os.path.basename(path)}",
+                )
+        else:
+            st.session_state.pop("ev_export")
+            st.info("내보내기 파일이 만료되어 삭제되었습니다. 다시 생성하세요.")
+
 with st.expander("🧪 Insert demo event"):
     c1, c2, c3 = st.columns(3)
     with c1:
@@ -1,38 +1,118 @@
 # edge_agent/main.py
-import time, sys, traceback, yaml
+# 기동 순서: 설정(캐시) → 저장소 + 첫 HEARTBEAT → 백그라운드 워밍업(cv2/numpy, 카메라, PPG, 특징 로그)
+# 워치독 재시작 직후에도 하트비트가 먼저 나가도록 무거운 모듈은 여기서 import 하지 않는다.
+import time
+_T0 = time.perf_counter()
+
+import argparse, signal, sys, threading, traceback
 from datetime import datetime
-from edge_agent.signals.cam import CamSource
-from edge_agent.signals.mic import MicSource
-from edge_agent.signals.ppg import PPGSource
-from edge_agent.utils.inference import RuleModel
+from edge_agent.utils.cache import cached_json
 from edge_agent.utils.storage import EventLogger
 from edge_agent.utils.alerts import Notifier
 
 CFG_PATH = "edge_agent/configs/default.yaml"
 
-def load_cfg(path=CFG_PATH):
+def _parse_yaml(path):
+    import yaml
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
-def main():
-    cfg = load_cfg()
-    cam = CamSource(cfg["source"]["video"])
-    mic = MicSource(cfg["source"]["audio"])
-    ppg = PPGSource(cfg["source"]["ppg_csv"])
-    model = RuleModel(cfg["thresholds"])
+def load_cfg(path=CFG_PATH):
+    return cached_json(path, _parse_yaml)
+
+class Warmup(threading.Thread):
+    """센서/모델 초기화를 메인 루프와 병렬로 수행."""
+
+    def __init__(self, cfg: dict):
+        super().__init__(name="rva-warmup", daemon=True)
+        self.cfg = cfg
+        self.parts = None
+        self.error = None
+
+    def run(self):
+        try:
+            from edge_agent.signals.cam import CamSource
+            from edge_agent.signals.mic import MicSource
+            from edge_agent.signals.ppg import PPGSource
+            from edge_agent.utils.inference import RuleModel
+            from edge_agent.utils.duty import DutyController
+
+            cfg = self.cfg
+            parts = {
+                "cam": CamSource(cfg["source"]["video"]),
+                "mic": MicSource(cfg["source"]["audio"]),
+                "ppg": PPGSource(cfg["source"]["ppg_csv"]),
+                "model": RuleModel(cfg["thresholds"]),
+                "features": None,
+                "duty": None,
+            }
+            if cfg.get("duty", {}).get("enabled", False):
+                parts["duty"] = DutyController(cfg["duty"], cfg["thresholds"])
+            if cfg.get("privacy", {}).get("store_features_only", False):
+                from edge_agent.utils.features import FeatureLog
+                fcfg = cfg.get("features", {})
+                parts["features"] = FeatureLog(
+                    fcfg.get("dir", "edge_agent/features"),
+                    chunk_records=fcfg.get("chunk_records", 512),
+                    segment_chunks=fcfg.get("segment_chunks", 64),
+                    max_bytes=int(fcfg.get("max_mb", 256)) * 1024 * 1024,
+                )
+            self.parts = parts
+        except Exception as e:
+            self.error = e
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--config", default=CFG_PATH)
+    args = ap.parse_args(argv)
+
+    # 워치독/systemd 종료(SIGTERM)도 finally 를 거치게 해 특징 로그 버퍼를 기록
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    cfg = load_cfg(args.config)
     logger = EventLogger(cfg["storage"]["sqlite_path"])
     notifier = Notifier(**cfg.get("alerts", {}))
     resident = cfg.get("resident", {"resident_id":"CB-001", "name":"A 어르신"})
 
-    print("[RuralVitals] Edge agent started.")
+    # 1단계: 모니터링 공백 최소화 — 센서 준비 전이라도 하트비트 먼저
+    logger.log(datetime.now().strftime("%Y-%m-%d %H:%M:%S"), resident["resident_id"], "HEARTBEAT", "INFO", "starting")
+    print(f"[RuralVitals] Edge agent started. first heartbeat {1000 * (time.perf_counter() - _T0):.0f} ms")
+
+    # 2단계: 무거운 초기화는 백그라운드
+    warm = Warmup(cfg)
+    warm.start()
+    parts = None
+    last_tick = None
 
     try:
         while True:
-            frame, motion = cam.read_motion()
-            hr = ppg.read_hr()
-            br = mic.read_brpm()
-            events = model.step(motion, hr, br)
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if parts is None:
+                # 워밍업 대기 중에도 1초마다 하트비트 유지
+                warm.join(timeout=1.0)
+                if warm.error is not None:
+                    raise warm.error
+                if warm.parts is None:
+                    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    logger.log(ts, resident["resident_id"], "HEARTBEAT", "INFO", "warming")
+                    continue
+                parts = warm.parts
+                print(f"[RuralVitals] sensors ready {1000 * (time.perf_counter() - _T0):.0f} ms")
+
+            tick = time.monotonic()
+            now = datetime.now()
+            ts = now.strftime("%Y-%m-%d %H:%M:%S")
+            duty = parts["duty"]
+            interval = duty.interval_sec if duty is not None else 1.0
+            dt = interval if last_tick is None else tick - last_tick
+            last_tick = tick
+
+            features = parts["features"]
+            frame, motion = parts["cam"].read_motion()
+            hr = parts["ppg"].read_hr()
+            br = parts["mic"].read_brpm()
+            events = parts["model"].step(motion, hr, br, dt=dt)
+            if features is not None:
+                features.append(resident["resident_id"], now.timestamp(), motion, hr, br)
 
             # HEARTBEAT
             logger.log(ts, resident["resident_id"], "HEARTBEAT", "INFO", "ok")
@@ -41,13 +121,26 @@ def main():
                 logger.log(ts, resident["resident_id"], kind, level, note)
                 notifier.send(kind, note)
 
-            time.sleep(1)
+            if duty is not None:
+                change = duty.update(motion, hr, br, events, dt=dt)
+                if change:
+                    prev, mode, reason = change
+                    note = f"{prev}→{mode}: {reason}"
+                    logger.log(ts, resident["resident_id"], "DUTY", "INFO", note)
+                    print(f"[DUTY][{ts}] {note}")
+                    parts["cam"].set_scale(duty.frame_scale)
+                interval = duty.interval_sec
+
+            time.sleep(max(0.0, interval - (time.monotonic() - tick)))
     except KeyboardInterrupt:
         pass
     except Exception as e:
         print("[FATAL]", e)
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if parts is not None and parts["features"] is not None:
+            parts["features"].close()
 
 if __name__ == "__main__":
     main()
@@ -4,19 +4,55 @@ import numpy as np
 
 class CamSource:
     def __init__(self, index=0):
-        self.cap = cv2.VideoCapture(index)
+        # index=None: 캡처 장치 없이 motion_from 만 사용 (재생 벤치마크 등)
+        self.cap = cv2.VideoCapture(index) if index is not None else None
         self.prev = None
+        self.scale = 1.0
+        self.size = None  # 배율 1.0 일 때 (폭, 높이)
+        if self.cap is not None:
+            w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            self.size = (w, h) if w and h else None
+
+    def _target(self):
+        w, h = self.size
+        return max(1, int(w * self.scale)), max(1, int(h * self.scale))
+
+    def set_scale(self, scale: float):
+        """
+        처리 해상도 배율 (적응형 듀티 사이클 eco 모드에서 축소).
+        카메라가 지원하면 캡처 해상도 자체를 낮춰 전송/디코드 비용도 줄이고,
+        영상 파일처럼 요청이 무시되면 motion_from 에서 축소한다.
+        """
+        self.scale = scale
+        if self.cap is not None and self.size is not None:
+            w, h = self._target()
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, w)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
 
     def read_motion(self):
         ok, frame = self.cap.read()
         if not ok or frame is None:
             return None, 0.0
+        return frame, self.motion_from(frame)
+
+    def motion_from(self, frame) -> float:
+        if self.size is None and self.scale == 1.0:
+            self.size = (frame.shape[1], frame.shape[0])
+        if self.scale != 1.0:
+            if self.size is None:
+                frame = cv2.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+            elif frame.shape[1] > self._target()[0]:
+                # 캡처 해상도가 그대로인 경우에만 축소
+                frame = cv2.resize(frame, self._target(), interpolation=cv2.INTER_AREA)
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         gray = cv2.GaussianBlur(gray, (9,9), 0)
         if self.prev is None:
             self.prev = gray
-            return frame, 0.0
+            return 0.0
+        if self.prev.shape != gray.shape:
+            # 배율 변경 직후: 기준 프레임을 새 크기로 맞춰 연속성 유지
+            self.prev = cv2.resize(self.prev, (gray.shape[1], gray.shape[0]), interpolation=cv2.INTER_AREA)
         diff = cv2.absdiff(self.prev, gray)
         self.prev = gray
-        motion = float(np.mean(diff) / 255.0)
-        return frame, motion
+        return float(np.mean(diff) / 255.0)
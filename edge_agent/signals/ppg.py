@@ -1,21 +1,24 @@
 # edge_agent/signals/ppg.py
 import csv
 
+from edge_agent.utils.cache import cached_floats
+
+def _parse_hr(csv_path: str):
+    with open(csv_path, newline="") as f:
+        return [float(row.get("hr_bpm", 72.0)) for row in csv.DictReader(f)]
+
 class PPGSource:
     def __init__(self, csv_path: str):
-        self.rows = []
-        with open(csv_path, newline="") as f:
-            r = csv.DictReader(f)
-            for row in r:
-                self.rows.append(row)
+        # 재시작 시 CSV 재파싱 대신 바이너리 캐시 사용
+        self.hr = cached_floats(csv_path, _parse_hr)
         self.i = 0
 
     def read_hr(self) -> float:
-        if not self.rows:
+        if not self.hr:
             return 72.0
-        if self.i >= len(self.rows):
+        if self.i >= len(self.hr):
             self.i = 0
         try:
-            return float(self.rows[self.i].get("hr_bpm", 72.0))
+            return self.hr[self.i]
         finally:
             self.i += 1
@@ -0,0 +1,78 @@
+# edge_agent/utils/cache.py
+"""
+재시작용 파싱 결과 캐시 (워치독 재기동 시 YAML/CSV 재파싱 생략).
+
+- 캐시 파일명에 원본 경로 + (mtime, size) 해시를 넣어 원본이 바뀌면 자동으로 미스
+- 쓰기는 임시 파일 → os.replace 로 원자적 (기록 중 강제 종료돼도 깨진 캐시를 읽지 않음)
+- stdlib(json/array)만 사용 → 캐시 적중 시 무거운 모듈 import 없음
+"""
+import hashlib
+import json
+import os
+from array import array
+from pathlib import Path
+from typing import Callable, Iterable
+
+CACHE_DIR = "edge_agent/.cache"
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def _cache_file(src: str, ext: str, cache_dir: str) -> Path:
+    # <파일명>-<경로 해시>-<버전 해시><ext> : 경로 해시가 같은 파일만 같은 원본의 캐시
+    st = os.stat(src)
+    src_key = _digest(os.path.abspath(src))
+    ver_key = _digest(f"{st.st_mtime_ns}:{st.st_size}")
+    return Path(cache_dir) / f"{Path(src).name}-{src_key}-{ver_key}{ext}"
+
+
+def _replace(path: Path, write: Callable):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 같은 원본(같은 경로 해시)의 예전 캐시 정리
+    for old in path.parent.glob(f"{path.name.rsplit('-', 1)[0]}-*{path.suffix}"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def cached_json(src: str, parse: Callable[[str], object], cache_dir: str = CACHE_DIR):
+    """src 를 parse 한 결과(JSON 직렬화 가능)를 캐시."""
+    path = _cache_file(src, ".json", cache_dir)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    obj = parse(src)
+    try:
+        text = json.dumps(obj, ensure_ascii=False)
+        # 날짜·비문자열 키 등 JSON 으로 왕복되지 않는 값이면 캐시하지 않음 (콜드/웜 기동 결과 동일 보장)
+        if json.loads(text) != obj:
+            return obj
+        _replace(path, lambda f: f.write(text.encode("utf-8")))
+    except (TypeError, ValueError, OSError):
+        pass  # 직렬화 불가 또는 읽기 전용 FS 등 — 캐시 없이 동작
+    return obj
+
+
+def cached_floats(src: str, parse: Callable[[str], Iterable[float]], cache_dir: str = CACHE_DIR) -> array:
+    """src 를 parse 한 float 시퀀스를 array('d') 바이너리로 캐시."""
+    path = _cache_file(src, ".f64", cache_dir)
+    try:
+        data = array("d")
+        with open(path, "rb") as f:
+            data.frombytes(f.read())
+        return data
+    except OSError:
+        pass
+    data = array("d", parse(src))
+    try:
+        _replace(path, data.tofile)
+    except OSError:
+        pass
+    return data
@@ -0,0 +1,162 @@
+# edge_agent/utils/duty.py
+"""
+적응형 듀티 사이클 — 상황에 따라 센싱 주기/해상도 조절.
+
+모드
+  eco    : 정상 상태가 steady_sec 이상 지속 → 주기↑, 프레임 축소 (CPU/전력 절감)
+  normal : 기본 1 Hz 전체 해상도
+  alert  : 움직임 저하 또는 HR/BR 이 임계값에 근접/이탈 → 최고 주기
+헤드룸(CPU 부하, SoC 온도)이 한계를 넘으면 한 단계 낮춘다
+  (위험 징후가 있으면 alert → normal, 아니면 eco 로).
+"""
+import glob
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from edge_agent.utils.inference import RuleThresholds
+
+@dataclass
+class ModeSpec:
+    interval_sec: float = 1.0
+    frame_scale: float = 1.0
+
+
+@dataclass
+class DutyConfig:
+    enabled: bool = False
+    modes: Dict[str, ModeSpec] = field(default_factory=lambda: {
+        "eco": ModeSpec(3.0, 0.5),
+        "normal": ModeSpec(1.0, 1.0),
+        "alert": ModeSpec(0.5, 1.0),
+    })
+    steady_sec: float = 30.0     # normal → eco 로 내려가기까지 정상 지속 시간
+    hold_sec: float = 10.0       # alert 해제 후 normal 유지 최소 시간
+    motion_low: float = 0.02     # 이하이면 무동작 후보로 보고 에스컬레이션
+    margin: float = 0.15         # HR/BR 정상 범위 폭 대비 경계 근접 비율
+    cpu_load_max: float = 0.85   # loadavg(1m) / 코어 수
+    temp_c_max: float = 75.0     # SoC 온도 (℃)
+    # 온도를 볼 thermal zone 의 type 부분 문자열 (Jetson 의 PMIC-Die 처럼 고정 100℃ 를 보고하는 zone 제외)
+    temp_zones: Tuple[str, ...] = ("cpu", "gpu", "soc")
+    headroom_every_sec: float = 5.0
+
+    @classmethod
+    def from_dict(cls, d: Optional[dict]) -> "DutyConfig":
+        d = dict(d or {})
+        modes = cls().modes
+        for name, spec in (d.pop("modes", None) or {}).items():
+            modes[name] = ModeSpec(**spec)
+        if "temp_zones" in d:
+            d["temp_zones"] = tuple(d["temp_zones"])
+        return cls(modes=modes, **d)
+
+
+def read_cpu_load() -> Optional[float]:
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+def read_soc_temp(zones=("cpu", "gpu", "soc")) -> Optional[float]:
+    """
+    Jetson/RPi: type 에 zones 중 하나가 포함된 thermal zone 의 최고 온도(℃). 없으면 None.
+    예) Jetson Nano CPU-therm/GPU-therm, RPi cpu-thermal
+    """
+    temps = []
+    for d in glob.glob("/sys/class/thermal/thermal_zone*"):
+        try:
+            with open(os.path.join(d, "type")) as f:
+                ztype = f.read().strip().lower()
+            if not any(z.lower() in ztype for z in zones):
+                continue
+            with open(os.path.join(d, "temp")) as f:
+                temps.append(int(f.read().strip()) / 1000.0)
+        except (OSError, ValueError):
+            continue
+    return max(temps) if temps else None
+
+
+class DutyController:
+    def __init__(self, cfg: dict, thresholds: dict, probe=None):
+        self.cfg = DutyConfig.from_dict(cfg)
+        self.th = RuleThresholds(**thresholds)
+        self.probe = probe or (lambda: (read_cpu_load(), read_soc_temp(self.cfg.temp_zones)))
+        self.mode = "normal"
+        self.calm_for = 0.0
+        self.hot = False
+        self._hot_reason = ""
+        self._since_probe = self.cfg.headroom_every_sec
+
+    @property
+    def spec(self) -> ModeSpec:
+        return self.cfg.modes[self.mode]
+
+    @property
+    def interval_sec(self) -> float:
+        return self.spec.interval_sec
+
+    @property
+    def frame_scale(self) -> float:
+        return self.spec.frame_scale
+
+    def _near(self, v: Optional[float], lo: float, hi: float) -> bool:
+        if v is None:
+            return False
+        band = (hi - lo) * self.cfg.margin
+        return v < lo + band or v > hi - band
+
+    def risk(self, motion: Optional[float], hr: Optional[float], br: Optional[float], events=()) -> Optional[str]:
+        """에스컬레이션 사유 (없으면 None)."""
+        if any(level == "ALERT" for _, level, _ in events):
+            return "alert event"
+        if motion is not None and motion <= self.cfg.motion_low:
+            return f"motion {motion:.3f} <= {self.cfg.motion_low}"
+        if self._near(hr, self.th.hr_bpm_low, self.th.hr_bpm_high):
+            return f"hr {hr:.0f} near threshold"
+        if self._near(br, self.th.resp_brpm_low, self.th.resp_brpm_high):
+            return f"br {br:.1f} near threshold"
+        return None
+
+    def _check_headroom(self, dt: float) -> Optional[str]:
+        self._since_probe += dt
+        if self._since_probe >= self.cfg.headroom_every_sec:
+            self._since_probe = 0.0
+            load, temp = self.probe()
+            reasons = []
+            if load is not None and load > self.cfg.cpu_load_max:
+                reasons.append(f"cpu {load:.2f}")
+            if temp is not None and temp > self.cfg.temp_c_max:
+                reasons.append(f"soc {temp:.0f}C")
+            self.hot = bool(reasons)
+            self._hot_reason = ", ".join(reasons)
+        return self._hot_reason if self.hot else None
+
+    def update(self, motion, hr, br, events=(), dt: float = 1.0) -> Optional[Tuple[str, str, str]]:
+        """
+        틱마다 호출. 모드가 바뀌면 (이전, 다음, 사유) 반환.
+        dt: 직전 틱 이후 경과 초
+        """
+        reason = self.risk(motion, hr, br, events)
+        if reason:
+            self.calm_for = 0.0
+            target = "alert"
+        else:
+            self.calm_for += dt
+            target = self.mode
+            if self.mode == "alert" and self.calm_for >= self.cfg.hold_sec:
+                target, reason = "normal", f"calm {self.calm_for:.0f}s"
+            elif self.mode == "normal" and self.calm_for >= self.cfg.steady_sec:
+                target, reason = "eco", f"steady {self.calm_for:.0f}s"
+
+        hot = self._check_headroom(dt)
+        if hot:
+            capped = "normal" if target == "alert" else "eco"
+            if capped != target:
+                target, reason = capped, f"backoff ({hot})"
+
+        if target == self.mode:
+            return None
+        change = (self.mode, target, reason or "")
+        self.mode = target
+        return change
@@ -0,0 +1,167 @@
+# edge_agent/utils/features.py
+"""
+엣지용 특징(feature) 로그 — privacy.store_features_only 구현.
+
+원본 프레임/오디오는 저장하지 않고 틱마다 (ts, motion, hr, br) 만 남긴다.
+
+레이아웃 (대상자별 디렉터리, append-only):
+  <root>/<resident_id>/seg_<첫 ts(정수초)>_n<chunk_records>.rvf
+  (청크 크기를 파일명에 기록 → 설정이 바뀌어도 기존 세그먼트를 올바르게 해석)
+  세그먼트 = 고정 크기 청크의 연속, 청크 = chunk_records 개 레코드를 열(column) 단위로 배치
+    [ts f8 × N][motion f4 × N][hr f4 × N][br f4 × N]
+
+- 틱마다 디스크에 쓰지 않고 청크가 찰 때 한 번에 write+fsync (SD 카드 쓰기 증폭 최소화)
+- 마지막 청크가 덜 찼을 때 flush 하면 ts=NaN 으로 채워 청크 경계 유지 (읽을 때 제외)
+- 세그먼트가 segment_chunks 개 청크로 차면 새 파일, 전체 용량이 max_bytes 를 넘으면 가장 오래된 세그먼트부터 삭제
+- 읽기는 np.memmap 으로 청크를 그대로 열 배열로 해석 → 복사/파싱 없이 구간 조회
+"""
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+FIELDS = ("motion", "hr", "br")
+SEG_SUFFIX = ".rvf"
+ROW_BYTES = 8 + 4 * len(FIELDS)
+
+
+def _f32(v) -> float:
+    return np.nan if v is None else float(v)
+
+
+def segment_chunk_records(path: Path) -> int:
+    """세그먼트 파일명(seg_<ts>_n<N>.rvf)에 기록된 청크당 레코드 수."""
+    parts = Path(path).stem.split("_")
+    if len(parts) != 3 or not parts[2].startswith("n") or not parts[2][1:].isdigit():
+        raise ValueError(f"unknown feature segment layout: {path}")
+    return int(parts[2][1:])
+
+
+class FeatureLog:
+    def __init__(
+        self,
+        root: str,
+        chunk_records: int = 512,
+        segment_chunks: int = 64,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.chunk_records = chunk_records
+        self.segment_chunks = segment_chunks
+        self.max_bytes = max_bytes
+        self.chunk_bytes = chunk_records * ROW_BYTES
+        self._buf: Dict[str, np.ndarray] = {}   # resident_id -> (N, 1+len(FIELDS)) f8 버퍼
+        self._fill: Dict[str, int] = {}
+        self._seg: Dict[str, Optional[Path]] = {}
+
+    # ---------- write ----------
+    def append(self, resident_id: str, ts: float, motion=None, hr=None, br=None):
+        buf = self._buf.get(resident_id)
+        if buf is None:
+            buf = self._buf[resident_id] = np.full((self.chunk_records, 1 + len(FIELDS)), np.nan)
+            self._fill[resident_id] = 0
+        i = self._fill[resident_id]
+        buf[i] = (ts, _f32(motion), _f32(hr), _f32(br))
+        self._fill[resident_id] = i + 1
+        if i + 1 == self.chunk_records:
+            self._write_chunk(resident_id)
+
+    def flush(self):
+        """덜 찬 청크도 NaN 패딩해서 기록 (종료 시 호출)."""
+        for rid, n in list(self._fill.items()):
+            if n:
+                self._write_chunk(rid)
+
+    def close(self):
+        self.flush()
+
+    def _encode(self, buf: np.ndarray) -> bytes:
+        parts = [buf[:, 0].astype("<f8").tobytes()]
+        parts += [buf[:, j + 1].astype("<f4").tobytes() for j in range(len(FIELDS))]
+        return b"".join(parts)
+
+    def _write_chunk(self, resident_id: str):
+        buf = self._buf[resident_id]
+        n = self._fill[resident_id]
+        buf[n:] = np.nan
+        seg = self._segment_for(resident_id, float(buf[0, 0]))
+        with open(seg, "ab") as f:
+            f.write(self._encode(buf))
+            f.flush()
+            os.fsync(f.fileno())
+        buf[:] = np.nan
+        self._fill[resident_id] = 0
+        if seg.stat().st_size >= self.chunk_bytes * self.segment_chunks:
+            self._seg[resident_id] = None
+            self._rotate()
+
+    def _segment_for(self, resident_id: str, first_ts: float) -> Path:
+        seg = self._seg.get(resident_id)
+        if seg is not None:
+            return seg
+        d = self.root / resident_id
+        d.mkdir(parents=True, exist_ok=True)
+        # 재시작 시 마지막 세그먼트가 덜 찼으면 이어 쓰기 (찢긴 청크는 잘라냄)
+        segs = self.segments(resident_id)
+        # 청크 크기가 다른 세그먼트(설정 변경 전)에는 이어 쓰지 않는다
+        if segs and segment_chunk_records(segs[-1]) == self.chunk_records:
+            last = segs[-1]
+            size = last.stat().st_size
+            whole = size - size % self.chunk_bytes
+            if whole != size:
+                os.truncate(last, whole)
+            if whole < self.chunk_bytes * self.segment_chunks:
+                self._seg[resident_id] = last
+                return last
+        seg = d / f"seg_{int(first_ts):010d}_n{self.chunk_records}{SEG_SUFFIX}"
+        self._seg[resident_id] = seg
+        return seg
+
+    def _rotate(self):
+        segs = sorted(self.root.glob(f"*/*{SEG_SUFFIX}"), key=lambda p: p.name)
+        active = {p for p in self._seg.values() if p is not None}
+        total = sum(p.stat().st_size for p in segs)
+        for p in segs:
+            if total <= self.max_bytes:
+                break
+            if p in active:
+                continue
+            total -= p.stat().st_size
+            p.unlink()
+
+    # ---------- read ----------
+    def segments(self, resident_id: str) -> List[Path]:
+        return sorted((self.root / resident_id).glob(f"seg_*{SEG_SUFFIX}"))
+
+    def read_segment(self, path: Path) -> Dict[str, np.ndarray]:
+        """세그먼트 1개를 memmap 으로 열어 열 배열 dict 반환 (NaN 패딩 제외)."""
+        N = segment_chunk_records(path)
+        chunk_bytes = N * ROW_BYTES
+        n_chunks = path.stat().st_size // chunk_bytes
+        if n_chunks == 0:
+            return {k: np.empty(0) for k in ("ts",) + FIELDS}
+        raw = np.memmap(path, dtype=np.uint8, mode="r", shape=(n_chunks, chunk_bytes))
+        cols = {"ts": raw[:, : 8 * N].view("<f8").reshape(-1)}
+        off = 8 * N
+        for name in FIELDS:
+            cols[name] = raw[:, off : off + 4 * N].view("<f4").reshape(-1)
+            off += 4 * N
+        keep = ~np.isnan(cols["ts"])
+        return {k: v[keep] for k, v in cols.items()}
+
+    def read_range(self, resident_id: str, t0: float, t1: float) -> Dict[str, np.ndarray]:
+        """[t0, t1] 구간 특징. 파일명(첫 ts)으로 범위 밖 세그먼트는 열지 않는다."""
+        segs = self.segments(resident_id)
+        starts = [int(p.stem.split("_")[1]) for p in segs]
+        out: Dict[str, list] = {k: [] for k in ("ts",) + FIELDS}
+        for i, p in enumerate(segs):
+            nxt = starts[i + 1] if i + 1 < len(starts) else None
+            if starts[i] > t1 or (nxt is not None and nxt < t0):
+                continue
+            cols = self.read_segment(p)
+            m = (cols["ts"] >= t0) & (cols["ts"] <= t1)
+            for k in out:
+                out[k].append(cols[k][m])
+        return {k: np.concatenate(v) if v else np.empty(0) for k, v in out.items()}
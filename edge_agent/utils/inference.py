@@ -12,16 +12,22 @@ class RuleThresholds:
 class RuleModel:
     def __init__(self, cfg: dict):
         self.cfg = RuleThresholds(**cfg)
-        self.motion_zero_for = 0  # 초 단위 카운터
+        self.motion_zero_for = 0.0  # 초 단위 누적 (첫 무동작 틱부터)
+        self.still = False
 
-    def step(self, motion: float, hr: float, br: float):
+    def step(self, motion: float, hr: float, br: float, dt: float = 1.0):
+        """dt: 직전 step 이후 경과 초 (적응형 듀티 사이클에서 틱 간격이 바뀜)"""
         evts = []
 
-        # 무동작 카운트
+        # 무동작 누적 — 직전 틱(움직임)과 이번 틱 사이 어디서 멈췄는지 모르므로
+        # 첫 무동작 틱의 간격은 더하지 않는다 (eco 3초 간격에서 조기 경보 방지)
         if motion <= 0.01:
-            self.motion_zero_for += 1
+            if self.still:
+                self.motion_zero_for += dt
+            self.still = True
         else:
-            self.motion_zero_for = 0
+            self.motion_zero_for = 0.0
+            self.still = False
 
         if self.motion_zero_for >= self.cfg.inactivity_sec:
             evts.append(("INACTIVITY", "ALERT", f"no motion ≥{self.cfg.inactivity_sec}s"))
@@ -4,6 +4,7 @@ from pathlib import Path
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS events(
+  id INTEGER PRIMARY KEY,
   ts TEXT NOT NULL,
   resident_id TEXT NOT NULL,
   kind TEXT NOT NULL,
@@ -0,0 +1,176 @@
+# scripts/bench_duty.py
+# 적응형 듀티 사이클 재생(replay) 벤치마크: 고정 1 Hz vs 적응형
+#   - 판단 신호(motion/hr/br)는 시나리오(또는 --trace CSV)에서, CPU 비용은 샘플 영상 프레임을 실제 처리해 측정
+#   - 프레임 CPU = 캡처 디코드(JPEG, 전체 해상도) + 움직임 처리. 카메라가 해상도 변경을 무시하는 경우를 가정한
+#     보수적 수치 — 지원하는 카메라에서는 eco 모드 디코드/전송 비용도 함께 줄어든다
+#   - 출력: 프레임 처리 CPU 시간, 틱 수, 모드 전환, 에피소드별 탐지 지연
+#   - 조건 성립 전에 울린 경보(조기/오경보)가 있으면 [FAIL] 과 종료 코드 1
+#   python scripts/bench_duty.py
+#   python scripts/bench_duty.py --trace my_trace.csv   # 컬럼: t,motion,hr,br (초 단위 t)
+#   python scripts/bench_duty.py --hot-at 300           # 300초부터 SoC 과열 가정(백오프 확인)
+import argparse, bisect, csv, os, sys, time
+
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from edge_agent.main import CFG_PATH, load_cfg
+from edge_agent.signals.cam import CamSource
+from edge_agent.utils.duty import DutyController
+from edge_agent.utils.inference import RuleModel
+
+def synthetic_trace(step=0.1):
+    """활동 → 무동작(200s~) → 활동 → HR 상승(400s~) → 정상, 총 600초."""
+    rows = []
+    n = int(600 / step)
+    for i in range(n):
+        t = i * step
+        motion = 0.0 if 200 <= t < 260 else 0.05
+        hr = 72.0
+        if 400 <= t < 430:
+            hr = min(130.0, 72.0 + (t - 400) * 3.0)
+        rows.append((t, motion, hr, 14.0))
+    return rows
+
+def load_trace(path):
+    with open(path, newline="") as f:
+        return [(float(r["t"]), float(r["motion"]), float(r["hr"]), float(r["br"])) for r in csv.DictReader(f)]
+
+def ground_truth(trace, th):
+    """
+    에피소드 목록과 샘플별 성립 조건.
+      episodes: (이름, 직전 같은 종류 에피소드가 해제된 시각, 조건 성립 시각)
+                무동작은 inactivity_sec 경과 시점, HR/BR 은 범위 이탈 시점
+      active  : 샘플마다 그 시각에 경보가 정당한 종류의 집합
+    """
+    episodes, active = [], []
+    still_from = None
+    on = {"INACTIVITY": False, "HR": False, "RESP": False}
+    cleared = {k: trace[0][0] for k in on}
+    for t, motion, hr, br in trace:
+        if motion <= 0.01:
+            still_from = t if still_from is None else still_from
+        else:
+            still_from = None
+        now = {
+            "INACTIVITY": still_from is not None and t - still_from >= th["inactivity_sec"],
+            "HR": hr < th["hr_bpm_low"] or hr > th["hr_bpm_high"],
+            "RESP": br < th["resp_brpm_low"] or br > th["resp_brpm_high"],
+        }
+        for k, v in now.items():
+            if v and not on[k]:
+                episodes.append((k, cleared[k], t))
+            elif on[k] and not v:
+                cleared[k] = t
+            on[k] = v
+        active.append({k for k, v in now.items() if v})
+    return episodes, active
+
+def load_frames(video, n):
+    cam = CamSource(video)
+    frames = []
+    while len(frames) < n:
+        ok, frame = cam.cap.read()
+        if not ok:
+            break
+        frames.append(frame)
+    cam.cap.release()
+    if not frames:
+        # 영상이 없거나 손상된 경우: 640x480 합성 프레임으로 대체 (CPU 비용 비교 목적)
+        import numpy as np
+        print(f"[WARN] 프레임을 읽을 수 없음: {video} → 640x480 합성 프레임 사용")
+        rng = np.random.default_rng(0)
+        frames = [rng.integers(0, 256, (480, 640, 3), dtype=np.uint8) for _ in range(n)]
+    # 카메라(MJPEG) 캡처처럼 매 틱 디코드하도록 JPEG 로 보관
+    return [cv2.imencode(".jpg", f)[1] for f in frames]
+
+def replay(trace, frames, cfg, adaptive, hot_at=None):
+    ts = [r[0] for r in trace]
+    end = ts[-1]
+    cam = CamSource(None)  # 캡처 장치 없이 처리 경로만 사용
+    model = RuleModel(cfg["thresholds"])
+    clock = {"t": 0.0}
+    duty = None
+    if adaptive:
+        probe = lambda: (0.1, 90.0 if hot_at is not None and clock["t"] >= hot_at else 40.0)
+        duty = DutyController(cfg.get("duty", {}), cfg["thresholds"], probe=probe)
+
+    t, dt, ticks, cpu = 0.0, 1.0, 0, 0.0
+    detections, transitions = [], []
+    while t <= end:
+        clock["t"] = t
+        _, motion, hr, br = trace[max(0, bisect.bisect_right(ts, t) - 1)]
+        c0 = time.process_time()
+        frame = cv2.imdecode(frames[ticks % len(frames)], cv2.IMREAD_COLOR)
+        cam.motion_from(frame)
+        cpu += time.process_time() - c0
+        events = model.step(motion, hr, br, dt=dt)
+        detections += [(kind, t) for kind, level, _ in events if level == "ALERT"]
+        interval = 1.0
+        if duty is not None:
+            change = duty.update(motion, hr, br, events, dt=dt)
+            if change:
+                transitions.append((t,) + change)
+                cam.set_scale(duty.frame_scale)
+            interval = duty.interval_sec
+        ticks += 1
+        dt = interval
+        t += interval
+    return cpu, ticks, detections, transitions
+
+def latency(eps, detections):
+    """
+    에피소드마다 직전 같은 종류 에피소드 해제 이후 첫 탐지까지의 지연.
+    음수 = 조건 성립 전에 울린 조기/오경보 (t >= t_on 만 보면 뒤따르는 반복 경보에 가려짐)
+    """
+    out = []
+    for name, t_from, t_on in eps:
+        hit = next((t for kind, t in detections if kind == name and t >= t_from - 1e-9), None)
+        out.append((name, t_on, None if hit is None else hit - t_on))
+    return out
+
+def false_alerts(trace, active, detections):
+    """조건이 성립하지 않는 시각에 울린 ALERT (조기 경보 포함)."""
+    ts = [r[0] for r in trace]
+    return [(kind, t) for kind, t in detections if kind not in active[max(0, bisect.bisect_right(ts, t) - 1)]]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--config", default=CFG_PATH)
+    ap.add_argument("--trace", default=None)
+    ap.add_argument("--video", default="edge_agent/examples/sample_video.mp4")
+    ap.add_argument("--frames", type=int, default=60)
+    ap.add_argument("--hot-at", type=float, default=None)
+    ap.add_argument("-v", "--verbose", action="store_true")
+    args = ap.parse_args()
+
+    cfg = load_cfg(args.config)
+    trace = load_trace(args.trace) if args.trace else synthetic_trace()
+    frames = load_frames(args.video, args.frames)
+    eps, active = ground_truth(trace, cfg["thresholds"])
+
+    results = {}
+    for name, adaptive in (("fixed 1Hz", False), ("adaptive", True)):
+        results[name] = replay(trace, frames, cfg, adaptive, args.hot_at)
+
+    failed = False
+    base_cpu = results["fixed 1Hz"][0]
+    h, w = cv2.imdecode(frames[0], cv2.IMREAD_COLOR).shape[:2]
+    print(f"trace: {trace[-1][0]:.0f}s, frame {w}x{h} (decode + motion)")
+    for name, (cpu, ticks, dets, trans) in results.items():
+        saving = 100.0 * (1 - cpu / base_cpu) if base_cpu else 0.0
+        print(f"\n[{name}] ticks={ticks} frame CPU={cpu * 1000:.0f} ms (CPU {saving:.0f}% saved vs fixed) transitions={len(trans)}")
+        for ep, t_on, lat in latency(eps, dets):
+            mark = "missed" if lat is None else f"{lat:5.1f}s" + ("  EARLY" if lat < -1e-9 else "")
+            print(f"  {ep:<10} at {t_on:6.1f}s  latency {mark}")
+        bad = false_alerts(trace, active, dets)
+        if bad:
+            failed = True
+            print(f"  [FAIL] {len(bad)} early/false alerts: " + ", ".join(f"{k}@{t:.1f}s" for k, t in bad[:5]))
+        if args.verbose:
+            for t, prev, mode, reason in trans:
+                print(f"    {t:7.1f}s {prev}→{mode}: {reason}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# scripts/bench_events_query.py
+# Events and Logs 조회 지연 벤치마크 (목표: 페이지당 < 200 ms)
+#   python scripts/bench_events_query.py --rows 2000000            # 합성 DB 생성 후 측정
+#   python scripts/bench_events_query.py --db big.db --rows 0      # 기존 DB 재사용 (생성 생략)
+# 필터별로 첫 페이지 / 깊은 페이지(--depth 번째) 지연과 내보내기 청크 처리량을 출력
+#   (메모 검색 + 선택적 필터 조합은 검색 상한에 걸려 페이지가 덜 찰 수 있음 → rows 열)
+import argparse, os, random, sqlite3, statistics, sys, tempfile, time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+from components.event_query import EventFilter, ensure_event_indexes, fetch_page, iter_chunks
+from components.registry import ensure_registry_schema
+
+TARGET_MS = 200
+COUNTIES = ["제천시", "청주시", "충주시", "괴산군", "단양군", "보은군", "영동군", "옥천군", "음성군", "증평군", "진천군"]
+KINDS = ["HEARTBEAT", "RESP", "HR", "INACTIVITY", "DUTY"]
+
+def build_db(path, rows, residents, batch=200_000):
+    """rows 건의 합성 이벤트 (note 의 ~90% 'ok', ~10% 'out of range')."""
+    con = sqlite3.connect(path)
+    con.execute("PRAGMA journal_mode=OFF")
+    con.execute("PRAGMA synchronous=OFF")
+    con.execute("CREATE TABLE IF NOT EXISTS events(id INTEGER PRIMARY KEY, ts TEXT, kind TEXT, level TEXT, note TEXT, resident_id TEXT, edge_id TEXT)")
+    ensure_registry_schema(con)
+    con.executemany(
+        "INSERT OR REPLACE INTO residents(resident_id, name, age, county, room) VALUES(?,?,?,?,?)",
+        [(f"CB-{i:03d}", f"대상자{i}", 80, COUNTIES[i % len(COUNTIES)], None) for i in range(1, residents + 1)],
+    )
+    rnd = random.Random(0)
+    t = datetime(2025, 1, 1)
+    step = timedelta(seconds=1)
+    done = 0
+    while done < rows:
+        n = min(batch, rows - done)
+        buf = []
+        for _ in range(n):
+            t += step
+            bad = rnd.random() < 0.1
+            buf.append((
+                t.strftime("%Y-%m-%d %H:%M:%S"),
+                rnd.choice(KINDS[1:4]) if bad else "HEARTBEAT",
+                "ALERT" if bad else "INFO",
+                f"hr≈{rnd.randint(120, 150)} bpm out of range" if bad else "ok",
+                f"CB-{rnd.randint(1, residents):03d}",
+                f"edge-{rnd.randint(1, 8):02d}",
+            ))
+        con.executemany("INSERT INTO events(ts, kind, level, note, resident_id, edge_id) VALUES(?,?,?,?,?,?)", buf)
+        con.commit()
+        done += n
+        print(f"  inserted {done:,}/{rows:,}", end="\r", flush=True)
+    print()
+    con.close()
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        samples.append(1000 * (time.perf_counter() - t0))
+    return statistics.median(samples), max(samples), out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", default=None, help="기본: 임시 파일")
+    ap.add_argument("--rows", type=int, default=2_000_000, help="생성할 행 수 (0 이면 생성 생략)")
+    ap.add_argument("--residents", type=int, default=120)
+    ap.add_argument("--page", type=int, default=100)
+    ap.add_argument("--depth", type=int, default=20, help="깊은 페이지 번호")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--export-chunks", type=int, default=5, help="내보내기 측정 청크 수 (50k 행/청크)")
+    args = ap.parse_args()
+
+    tmp = None
+    db = args.db
+    if db is None:
+        tmp = tempfile.TemporaryDirectory()
+        db = os.path.join(tmp.name, "bench_events.db")
+    if args.rows:
+        print(f"[build] {db}")
+        t0 = time.perf_counter()
+        build_db(db, args.rows, args.residents)
+        print(f"[build] {time.perf_counter() - t0:.1f}s")
+
+    con = sqlite3.connect(db)
+    t0 = time.perf_counter()
+    has_fts = ensure_event_indexes(con)
+    ensure_registry_schema(con)
+    total = con.execute("SELECT MAX(rowid) FROM events").fetchone()[0] or 0
+    print(f"[index] {time.perf_counter() - t0:.1f}s  rows≈{total:,}  fts={has_fts}")
+
+    cases = {
+        "no filter": EventFilter(),
+        "resident": EventFilter(resident_ids=["CB-007"]),
+        "county": EventFilter(counties=["단양군"]),
+        "kind+level": EventFilter(kinds=["HR"], levels=["ALERT"]),
+        "edge+range": EventFilter(edge_ids=["edge-03"], ts_from="2025-01-05 00:00:00", ts_to="2025-01-10 00:00:00"),
+        "text rare": EventFilter(text="out of range"),
+        "text common": EventFilter(text="ok"),
+        "text+county": EventFilter(text="out of range", counties=["단양군"]),
+        # 흔한 검색어 + 선택적 필터 (교집합이 비거나 작음)
+        "text+level": EventFilter(text="ok", levels=["ALERT"]),
+        "text+range": EventFilter(text="ok", ts_from="2025-01-01 00:00:00", ts_to="2025-01-01 06:00:00"),
+        "text+res": EventFilter(text="ok", resident_ids=["CB-007"], kinds=["HR"]),
+        "rare+range": EventFilter(text="out of range", levels=["ALERT"], ts_from="2025-01-02 00:00:00", ts_to="2025-01-02 01:00:00"),
+    }
+    worst = 0.0
+    print(f"\n{'filter':<14}{'page1 p50':>11}{'max':>9}{'rows':>6}{f'page{args.depth} p50':>13}{'max':>9}")
+    for name, flt in cases.items():
+        p50, mx, (df, cur) = timed(lambda: fetch_page(con, flt, limit=args.page, has_fts=has_fts), args.repeat)
+        # 깊은 페이지 커서까지 이동 (측정 제외)
+        for _ in range(args.depth - 2):
+            if cur is None:
+                break
+            _, cur = fetch_page(con, flt, after=cur, limit=args.page, has_fts=has_fts)
+        if cur is not None:
+            d50, dmx, _ = timed(lambda: fetch_page(con, flt, after=cur, limit=args.page, has_fts=has_fts), args.repeat)
+        else:
+            d50 = dmx = float("nan")
+        worst = max(worst, mx, dmx if dmx == dmx else 0.0)
+        print(f"{name:<14}{p50:9.1f}ms{mx:7.1f}ms{len(df):6d}{d50:11.1f}ms{dmx:7.1f}ms")
+
+    for name in ("no filter", "text common", "text+level"):
+        t0 = time.perf_counter()
+        n = 0
+        for i, chunk in enumerate(iter_chunks(con, cases[name], has_fts=has_fts)):
+            n += len(chunk)
+            if i + 1 >= args.export_chunks:
+                break
+        dt = time.perf_counter() - t0
+        print(f"[export] {name}: {n:,} rows in {dt:.2f}s ({n / dt / 1000:.0f}k rows/s)" if dt else "")
+
+    print(f"\nworst page latency: {worst:.1f} ms (target < {TARGET_MS} ms) {'OK' if worst < TARGET_MS else 'SLOW'}")
+    con.close()
+    if tmp is not None:
+        tmp.cleanup()
+
+if __name__ == "__main__":
+    main()
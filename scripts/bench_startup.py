@@ -0,0 +1,111 @@
+# scripts/bench_startup.py
+# 엣지 에이전트 기동 시간 벤치마크 + import 시간 리포트
+#   python scripts/bench_startup.py --runs 5      # 프로세스 생성 → 첫 HEARTBEAT / 센서 준비(ok) 시간
+#   python scripts/bench_startup.py --imports     # python -X importtime 누적 상위 모듈
+import argparse, glob, json, os, sqlite3, statistics, subprocess, sys, tempfile, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from edge_agent.main import CFG_PATH, load_cfg
+from edge_agent.utils.cache import CACHE_DIR
+
+TARGET_MS = 300
+
+def first_row_ms(db_path, t_spawn, note, timeout):
+    """events 에 해당 note 의 HEARTBEAT 가 처음 보일 때까지 ms (없으면 None)."""
+    while time.perf_counter() - t_spawn < timeout:
+        if os.path.exists(db_path):
+            try:
+                con = sqlite3.connect(db_path)
+                row = con.execute(
+                    "SELECT 1 FROM events WHERE kind='HEARTBEAT' AND note=? LIMIT 1", (note,)
+                ).fetchone()
+                con.close()
+                if row:
+                    return 1000 * (time.perf_counter() - t_spawn)
+            except sqlite3.OperationalError:
+                pass  # 스키마 생성 중
+        time.sleep(0.005)
+    return None
+
+def write_bench_cfg(cfg, tmp):
+    """임시 DB/특징 경로를 가리키는 설정을 한 번만 기록 (mtime 고정 → 2회차부터 설정 캐시 적중)."""
+    cfg = json.loads(json.dumps(cfg))
+    cfg["storage"]["sqlite_path"] = os.path.join(tmp, "bench.db")
+    cfg.setdefault("features", {})["dir"] = os.path.join(tmp, "features")
+    cfg_path = os.path.join(tmp, "bench.yaml")  # JSON 은 YAML 의 부분집합
+    with open(cfg_path, "w", encoding="utf-8") as f:
+        json.dump(cfg, f, ensure_ascii=False)
+    return cfg_path, cfg["storage"]["sqlite_path"]
+
+def run_once(cfg_path, db_path, timeout):
+    if os.path.exists(db_path):
+        os.remove(db_path)  # 회차마다 새 DB — 이전 회차 하트비트와 구분
+    t_spawn = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "edge_agent.main", "--config", cfg_path],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        hb = first_row_ms(db_path, t_spawn, "starting", timeout)
+        ready = first_row_ms(db_path, t_spawn, "ok", timeout)
+    finally:
+        proc.terminate()
+        proc.wait()
+    return hb, ready
+
+def bench(args):
+    cfg = load_cfg(args.config)
+    if args.video is not None:
+        cfg["source"]["video"] = args.video
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg_path, db_path = write_bench_cfg(cfg, tmp)
+        results = [run_once(cfg_path, db_path, args.timeout) for _ in range(args.runs)]
+    # 임시 설정의 캐시 파일 정리
+    for p in glob.glob(os.path.join(CACHE_DIR, "bench.yaml-*")):
+        os.remove(p)
+    for i, (hb, ready) in enumerate(results):
+        tag = "cold" if i == 0 else "warm"
+        fmt = lambda v: "timeout" if v is None else f"{v:7.1f} ms"
+        print(f"run {i+1} ({tag}): first heartbeat {fmt(hb)} | sensors ready {fmt(ready)}")
+    hbs = [hb for hb, _ in results[1:] if hb is not None]
+    if hbs:
+        med = statistics.median(hbs)
+        print(f"warm median first heartbeat: {med:.1f} ms (target < {TARGET_MS} ms) {'OK' if med < TARGET_MS else 'SLOW'}")
+
+def import_report(args):
+    """python -X importtime 결과를 누적(us) 기준 상위 N개로 정리."""
+    for target in ["edge_agent.main", "edge_agent.signals.cam", "edge_agent.utils.features", "yaml"]:
+        out = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+            capture_output=True, text=True,
+        ).stderr
+        rows = []
+        for line in out.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            self_us, cum_us, name = [p.strip() for p in line.split(":", 1)[1].split("|")]
+            rows.append((int(cum_us), int(self_us), name))
+        if not rows:
+            print(f"\n== import {target}: failed\n{out.strip().splitlines()[-1] if out.strip() else ''}")
+            continue
+        total = max(r[0] for r in rows)
+        print(f"\n== import {target}: {total / 1000:.1f} ms total")
+        for cum, self_, name in sorted(rows, reverse=True)[: args.top]:
+            print(f"  {cum / 1000:8.1f} ms cum  {self_ / 1000:7.1f} ms self  {name}")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--config", default=CFG_PATH)
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--timeout", type=float, default=15.0)
+    ap.add_argument("--video", default="edge_agent/examples/sample_video.mp4", help="카메라 대신 사용할 영상 (기본: 샘플)")
+    ap.add_argument("--imports", action="store_true", help="import 시간 리포트만 출력")
+    ap.add_argument("--top", type=int, default=15)
+    args = ap.parse_args()
+    if args.imports:
+        import_report(args)
+    else:
+        bench(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# scripts/export_features.py
+# 엣지 특징 로그(edge_agent/features) → Parquet. 세그먼트 1개 = row group 1개로 스트리밍 기록.
+# 분석 PC에서 실행 (pyarrow 필요: pip install pyarrow)
+import argparse, os, sys
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from edge_agent.utils.features import FIELDS, FeatureLog
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dir", default="edge_agent/features")
+    ap.add_argument("--out", default="features.parquet")
+    ap.add_argument("--resident", action="append", help="대상자 ID (여러 번 지정 가능, 기본: 전체)")
+    ap.add_argument("--from-ts", type=float, default=None, help="epoch 초 (포함)")
+    ap.add_argument("--to-ts", type=float, default=None, help="epoch 초 (포함)")
+    args = ap.parse_args()
+
+    log = FeatureLog(args.dir)  # 청크 크기는 세그먼트 파일명에서 읽음
+    residents = args.resident or sorted(p.name for p in Path(args.dir).iterdir() if p.is_dir())
+    t0 = args.from_ts if args.from_ts is not None else float("-inf")
+    t1 = args.to_ts if args.to_ts is not None else float("inf")
+
+    schema = pa.schema(
+        [("resident_id", pa.string()), ("ts", pa.timestamp("ms"))]
+        + [(name, pa.float32()) for name in FIELDS]
+    )
+    n = 0
+    with pq.ParquetWriter(args.out, schema, compression="zstd") as writer:
+        for rid in residents:
+            for seg in log.segments(rid):
+                cols = log.read_segment(seg)
+                m = (cols["ts"] >= t0) & (cols["ts"] <= t1)
+                if not m.any():
+                    continue
+                ts_ms = (cols["ts"][m] * 1000).astype("int64")
+                arrays = [pa.array([rid] * int(m.sum())), pa.array(ts_ms, type=pa.timestamp("ms"))]
+                arrays += [pa.array(cols[name][m]) for name in FIELDS]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                n += int(m.sum())
+    print(f"[OK] residents={len(residents)}, rows={n} -> {args.out}")
+
+if __name__ == "__main__":
+    main()
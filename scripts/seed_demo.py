@@ -1,7 +1,10 @@
 # scripts/seed_demo.py
-import argparse, sqlite3, random
+import argparse, csv, os, sqlite3, random, sys
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+from components.registry import REGISTRY_COLS, ensure_registry_schema, import_registry_csv
+
 REGIONS = [
     "제천시","청주시","충주시",
     "괴산군","단양군","보은군","영동군","옥천군","음성군","증평군","진천군"
@@ -11,16 +14,8 @@ NAMES = ["김영희","박철수","이순자","최민호","정미숙","강동욱"
 
 def ensure_schema(con):
     cur = con.cursor()
-    # residents
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS residents(
-        resident_id TEXT PRIMARY KEY,
-        name TEXT,
-        age INTEGER,
-        region TEXT,
-        room TEXT
-    );
-    """)
+    # residents 는 대시보드 등록부 저장소가 관리 (CSV → residents)
+    ensure_registry_schema(con)
     # heartbeats
     cur.execute("""
     CREATE TABLE IF NOT EXISTS heartbeats(
@@ -36,6 +31,7 @@ def ensure_schema(con):
     # events (없던 컬럼 자동 보강)
     cur.execute("""
     CREATE TABLE IF NOT EXISTS events(
+        id INTEGER PRIMARY KEY,
         ts TEXT,
         kind TEXT,
         level TEXT,
@@ -55,9 +51,15 @@ def gen_room(i):
     wing = "ABCD"[(i//100) % 4]
     return f"{wing}-{100+(i%100):03d}"
 
-def seed_residents(con, count):
-    cur = con.cursor()
-    existing = {r[0] for r in cur.execute("SELECT resident_id FROM residents").fetchall()}
+def seed_residents(con, count, registry_csv):
+    """
+    없는 대상자만 등록부 CSV 에 추가한 뒤 residents 로 재적재.
+    CSV 가 기준이므로 테이블에 직접 넣지 않는다 (대시보드 재적재 때 사라짐).
+    """
+    existing = set()
+    if os.path.exists(registry_csv):
+        with open(registry_csv, newline="", encoding="utf-8-sig") as f:
+            existing = {(r.get("resident_id") or "").strip() for r in csv.DictReader(f)}
     new_rows = []
     for i in range(1, count+1):
         rid = gen_resident_id(i)
@@ -66,9 +68,22 @@ def seed_residents(con, count):
             rid, random.choice(NAMES), random.randint(74, 89),
             random.choice(REGIONS), gen_room(i)
         ))
-    if new_rows:
-        cur.executemany("INSERT INTO residents(resident_id,name,age,region,room) VALUES(?,?,?,?,?)", new_rows)
-        con.commit()
+    fresh = not os.path.exists(registry_csv) or os.path.getsize(registry_csv) == 0
+    if new_rows or fresh:
+        os.makedirs(os.path.dirname(registry_csv) or ".", exist_ok=True)
+        if not fresh:
+            with open(registry_csv, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                missing_newline = f.read(1) not in (b"\n", b"\r")
+        # 새 파일만 BOM+헤더, 기존 파일은 이어 쓰기
+        with open(registry_csv, "a", newline="", encoding="utf-8-sig" if fresh else "utf-8") as f:
+            w = csv.writer(f)
+            if fresh:
+                w.writerow(REGISTRY_COLS)
+            elif missing_newline:
+                f.write("\r\n")
+            w.writerows(new_rows)
+    import_registry_csv(con, registry_csv)
     return count
 
 def seed_streams(con, days, hb_interval_sec, residents, edge_nodes):
@@ -121,6 +136,7 @@ def seed_streams(con, days, hb_interval_sec, residents, edge_nodes):
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--db", default="edge_agent/rva_events.db")
+    ap.add_argument("--registry", default="data/resident_registry.csv", help="대상자 등록부 CSV (없는 대상자 추가)")
     ap.add_argument("--residents", type=int, default=12)
     ap.add_argument("--edges", type=int, default=3)
     ap.add_argument("--days", type=int, default=2)
@@ -136,7 +152,7 @@ def main():
         cur.execute("DELETE FROM events;")
         con.commit()
 
-    seed_residents(con, args.residents)
+    seed_residents(con, args.residents, args.registry)
     hb, ev = seed_streams(con, args.days, args.hb_interval, args.residents, args.edges)
 
     cur = con.cursor()